@@ -1,15 +1,24 @@
 """import os"""
 import os
 from flask import Flask
+from gevent.pywsgi import WSGIServer
 
 app = Flask(__name__)
 
+# Debug mode is opt-in; anything other than an explicit truthy value keeps it off
+DEBUG_MODE = os.environ.get('DEBUG_MODE', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+LISTEN_HOST = os.environ.get('LISTEN_HOST', '0.0.0.0')
+LISTEN_PORT = int(os.environ.get('LISTEN_PORT', 4000))
+# Use the GREETING environment variable if set; resolved once since / is hit by probes
+GREETING = os.environ.get('GREETING', 'Hello Petar Tijanic :)')
+
 @app.route('/')
 def index():
     """homepage"""
-    # Use the GREETING environment variable if set
-    greeting = os.environ.get('GREETING', 'Hello Petar Tijanic :)')
-    return greeting
+    return GREETING
 
 if __name__ == '__main__':
-    app.run(host="0.0.0.0", port=4000, debug=True)
+    if DEBUG_MODE:
+        app.run(host=LISTEN_HOST, port=LISTEN_PORT, debug=True)
+    else:
+        WSGIServer((LISTEN_HOST, LISTEN_PORT), app).serve_forever()